@@ -1,24 +1,19 @@
 """Main CLI entry point."""
+import importlib
 import click
 from pathlib import Path
 from typing import Optional
-from ..generators import (
-    ImageGenerator, DocumentGenerator, VideoGenerator,
-    AudioGenerator, WebGenerator, SyslogGenerator
-)
-from ..distributors import (
-    S3Distributor, EmailDistributor, SMSDistributor,
-    WhatsAppDistributor, WebDistributor
-)
 from ..utils.config import Config
-from ..utils.prompts import get_random_prompt, get_all_prompts
+from ..utils.prompts import get_random_prompt, get_random_prompts, get_all_prompts
 
-Config.ensure_directories()
+# Generator and distributor backends pull in heavy optional dependencies
+# (moviepy, boto3, twilio, ...), so they are imported only by the branch
+# that needs them.
 
 @click.group()
 def cli():
     """Indirect Prompt Tester - Framework for testing agents against indirect prompts."""
-    pass
+    Config.ensure_directories()
 
 @cli.command()
 @click.option('--type', '-t', required=True,
@@ -39,22 +34,28 @@ def generate(type: str, prompt: Optional[str], output: str, method: str, format:
     
     try:
         if type == 'image':
+            from ..generators.image import ImageGenerator
             generator = ImageGenerator()
             generator.generate(prompt, output_path, method=method)
         elif type == 'document':
+            from ..generators.document import DocumentGenerator
             doc_type = format or 'docx'
             generator = DocumentGenerator()
             generator.generate(prompt, output_path, doc_type=doc_type, method=method)
         elif type == 'video':
+            from ..generators.video import VideoGenerator
             generator = VideoGenerator()
             generator.generate(prompt, output_path, method=method)
         elif type == 'audio':
+            from ..generators.audio import AudioGenerator
             generator = AudioGenerator()
             generator.generate(prompt, output_path, method=method)
         elif type == 'web':
+            from ..generators.web import WebGenerator
             generator = WebGenerator()
             generator.generate(prompt, output_path, method=method)
         elif type == 'syslog':
+            from ..generators.syslog import SyslogGenerator
             generator = SyslogGenerator()
             generator.generate(prompt, output_path, method=method)
         
@@ -66,17 +67,32 @@ def generate(type: str, prompt: Optional[str], output: str, method: str, format:
         click.echo(f"✗ Error generating file: {e}", err=True)
         raise click.Abort()
 
+# Distribution method -> (module, class, display name, required options, accepted options)
+_DISTRIBUTORS = {
+    's3': ('s3', 'S3Distributor', 'S3', (), ('bucket', 'public')),
+    'email': ('email', 'EmailDistributor', 'email', ('recipient',), ('recipient',)),
+    'sms': ('sms', 'SMSDistributor', 'SMS', ('recipient', 'file_url'), ('recipient', 'file_url')),
+    'whatsapp': ('whatsapp', 'WhatsAppDistributor', 'WhatsApp', ('recipient', 'file_url'), ('recipient', 'file_url')),
+    'web': ('web', 'WebDistributor', 'web', (), ()),
+}
+
+_OPTION_LABELS = {
+    'recipient': 'Recipient',
+    'file_url': 'File URL',
+}
+
 @cli.command()
 @click.option('--file', '-f', required=True, help='Path to file to distribute')
 @click.option('--method', '-m', required=True,
-              type=click.Choice(['s3', 'email', 'sms', 'whatsapp', 'web']),
+              type=click.Choice(list(_DISTRIBUTORS)),
               help='Distribution method')
 @click.option('--recipient', '-r', help='Recipient (email, phone, etc.)')
+@click.option('--recipients', help='Comma-separated phone numbers for a bulk SMS/WhatsApp send')
 @click.option('--url', '-u', help='File URL (for SMS/WhatsApp)')
 @click.option('--bucket', '-b', help='S3 bucket name')
 @click.option('--public', is_flag=True, help='Make S3 file public')
-def distribute(file: str, method: str, recipient: Optional[str], url: Optional[str],
-               bucket: Optional[str], public: bool):
+def distribute(file: str, method: str, recipient: Optional[str], recipients: Optional[str],
+               url: Optional[str], bucket: Optional[str], public: bool):
     """Distribute a file via various methods."""
     file_path = Path(file)
     
@@ -84,39 +100,44 @@ def distribute(file: str, method: str, recipient: Optional[str], url: Optional[s
         click.echo(f"✗ File not found: {file_path}", err=True)
         raise click.Abort()
     
+    module_name, class_name, display_name, required, accepted = _DISTRIBUTORS[method]
+    options = {'recipient': recipient, 'file_url': url, 'bucket': bucket, 'public': public}
+    
+    bulk_recipients = []
+    if recipients and method in ('sms', 'whatsapp'):
+        bulk_recipients = [r.strip() for r in recipients.split(',') if r.strip()]
+        if recipient:
+            bulk_recipients.insert(0, recipient)
+    
+    missing = [
+        _OPTION_LABELS[name] for name in required
+        if not options[name] and not (name == 'recipient' and bulk_recipients)
+    ]
+    if missing:
+        for label in missing:
+            click.echo(f"✗ {label} required for {display_name} distribution", err=True)
+        raise click.Abort()
+    
     try:
-        if method == 's3':
-            distributor = S3Distributor()
-            result = distributor.distribute(file_path, bucket=bucket, public=public)
-        elif method == 'email':
-            if not recipient:
-                click.echo("✗ Recipient required for email distribution", err=True)
-                raise click.Abort()
-            distributor = EmailDistributor()
-            result = distributor.distribute(file_path, recipient=recipient)
-        elif method == 'sms':
-            if not recipient:
-                click.echo("✗ Recipient required for SMS distribution", err=True)
-                raise click.Abort()
-            if not url:
-                click.echo("✗ File URL required for SMS distribution", err=True)
-                raise click.Abort()
-            distributor = SMSDistributor()
-            result = distributor.distribute(file_path, recipient=recipient, file_url=url)
-        elif method == 'whatsapp':
-            if not recipient:
-                click.echo("✗ Recipient required for WhatsApp distribution", err=True)
-                raise click.Abort()
-            if not url:
-                click.echo("✗ File URL required for WhatsApp distribution", err=True)
-                raise click.Abort()
-            distributor = WhatsAppDistributor()
-            result = distributor.distribute(file_path, recipient=recipient, file_url=url)
-        elif method == 'web':
-            distributor = WebDistributor()
-            result = distributor.distribute(file_path)
+        module = importlib.import_module(f"..distributors.{module_name}", __package__)
+        distributor = getattr(module, class_name)()
+        try:
+            if bulk_recipients:
+                results = distributor.distribute_bulk(file_path, bulk_recipients, file_url=url)
+            else:
+                call_kwargs = {name: options[name] for name in accepted}
+                result = distributor.distribute(file_path, **call_kwargs)
+        finally:
+            if hasattr(distributor, 'close'):
+                distributor.close()
         
-        if result.get('success'):
+        if bulk_recipients:
+            for result in results:
+                if result.get('success'):
+                    click.echo(f"✓ {result['recipient']}: {result['message_sid']}")
+                else:
+                    click.echo(f"✗ {result['recipient']}: {result.get('error', 'Unknown error')}", err=True)
+        elif result.get('success'):
             click.echo(f"✓ File distributed via {method}")
             if 'url' in result:
                 click.echo(f"  URL: {result['url']}")
@@ -137,6 +158,14 @@ def list_prompts():
     for i, prompt in enumerate(prompts, 1):
         click.echo(f"  {i}. {prompt}")
 
+@cli.command()
+@click.option('--count', '-n', default=1, type=click.IntRange(min=1),
+              help='Number of prompts to draw')
+def random_prompts(count: int):
+    """Print random example prompts, one per line."""
+    for prompt in get_random_prompts(count):
+        click.echo(prompt)
+
 if __name__ == '__main__':
     cli()
 
@@ -1,13 +1,21 @@
 """Distribution modules for sending files via various channels."""
-from .base import BaseDistributor
-from .s3 import S3Distributor
-from .email import EmailDistributor
-from .sms import SMSDistributor
-from .whatsapp import WhatsAppDistributor
-from .web import WebDistributor
+import importlib
+
+from .base import BaseDistributor, MessageDistributor
+
+# Backends are imported on first attribute access (PEP 562) so that using
+# one distributor does not load boto3, twilio, etc. for all the others.
+_DISTRIBUTOR_MODULES = {
+    "S3Distributor": ".s3",
+    "EmailDistributor": ".email",
+    "SMSDistributor": ".sms",
+    "WhatsAppDistributor": ".whatsapp",
+    "WebDistributor": ".web",
+}
 
 __all__ = [
     "BaseDistributor",
+    "MessageDistributor",
     "S3Distributor",
     "EmailDistributor",
     "SMSDistributor",
@@ -15,3 +23,11 @@ __all__ = [
     "WebDistributor",
 ]
 
+def __getattr__(name):
+    if name in _DISTRIBUTOR_MODULES:
+        module = importlib.import_module(_DISTRIBUTOR_MODULES[name], __name__)
+        return getattr(module, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
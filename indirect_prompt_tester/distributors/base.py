@@ -1,7 +1,8 @@
 """Base distributor class for all distribution methods."""
 from abc import ABC, abstractmethod
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
+from concurrent.futures import ThreadPoolExecutor
 
 class BaseDistributor(ABC):
     """Base class for all distributors."""
@@ -29,3 +30,92 @@ class BaseDistributor(ABC):
         """Get the name of the distributor."""
         pass
 
+class MessageDistributor(BaseDistributor):
+    """
+    Base class for distributors that message a file link to recipients.
+    
+    Subclasses set self.client (a Twilio client) and implement _send; single
+    and bulk sends share the readiness check and message text defined here.
+    """
+    
+    client = None
+    
+    def distribute(
+        self,
+        file_path: Path,
+        recipient: str,
+        file_url: Optional[str] = None,
+        message: Optional[str] = None,
+        **kwargs
+    ) -> Dict[str, Any]:
+        """
+        Send a file link to one recipient.
+        
+        Args:
+            file_path: Path to file (for reference)
+            recipient: Recipient address (E.164 phone number)
+            file_url: URL to the file (required)
+            message: Custom message text
+        """
+        self._check_ready(file_url)
+        return self._send(recipient, self._message_body(file_url, message))
+    
+    def distribute_bulk(
+        self,
+        file_path: Path,
+        recipients: List[str],
+        file_url: Optional[str] = None,
+        message: Optional[str] = None,
+        max_workers: int = 16,
+        **kwargs
+    ) -> List[Dict[str, Any]]:
+        """
+        Send a file link to several recipients concurrently.
+        
+        Args:
+            file_path: Path to file (for reference)
+            recipients: Recipient addresses (E.164 phone numbers)
+            file_url: URL to the file (required)
+            message: Custom message text
+            max_workers: Maximum number of sends in flight
+        
+        Returns:
+            One result dictionary per recipient, in input order
+        """
+        self._check_ready(file_url)
+        if not recipients:
+            return []
+        
+        body = self._message_body(file_url, message)
+        workers = min(max_workers, len(recipients))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(lambda recipient: self._send(recipient, body), recipients))
+    
+    def _check_ready(self, file_url: Optional[str]):
+        """Raise if the client or file URL needed for sending is missing."""
+        if not self.client:
+            raise ValueError("Twilio client not configured. Set credentials in .env file.")
+        
+        if not file_url:
+            raise ValueError(
+                f"file_url is required for {self.get_name()} distribution. Upload file first or provide URL."
+            )
+    
+    @staticmethod
+    def _message_body(file_url: str, message: Optional[str]) -> str:
+        """Return the custom message, or the default text linking to the file."""
+        return message or f"Please access this file: {file_url}"
+    
+    @abstractmethod
+    def _send(self, recipient: str, body: str) -> Dict[str, Any]:
+        """
+        Send a single message.
+        
+        Args:
+            recipient: Recipient address
+            body: Message text
+        
+        Returns:
+            Result dictionary; failures are reported, not raised
+        """
+        pass
@@ -1,17 +1,30 @@
 """Email distributor for sending files via email."""
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Iterator, Optional
+from contextlib import contextmanager
+import mmap
 import smtplib
-from email.mime.multipart import MIMEMultipart
-from email.mime.text import MIMEText
-from email.mime.base import MIMEBase
-from email import encoders
+import threading
+from email.message import EmailMessage
 from .base import BaseDistributor
 from ..utils.config import Config
 
 class EmailDistributor(BaseDistributor):
     """Distributor for sending files via email."""
     
+    # Attachments larger than this are memory-mapped instead of read into bytes
+    MMAP_THRESHOLD = 16 * 1024 * 1024
+    
+    def __init__(self):
+        self._smtp = None
+        self._lock = threading.Lock()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+    
     def distribute(
         self,
         file_path: Path,
@@ -33,33 +46,31 @@ class EmailDistributor(BaseDistributor):
             raise ValueError("SMTP credentials not configured. Set in .env file.")
         
         try:
-            msg = MIMEMultipart()
+            msg = EmailMessage()
             msg['From'] = Config.SMTP_USERNAME
             msg['To'] = recipient
             msg['Subject'] = subject or f"File: {file_path.name}"
             
             body_text = body or f"Please find attached: {file_path.name}"
-            msg.attach(MIMEText(body_text, 'plain'))
+            msg.set_content(body_text)
             
-            # Attach file
-            with open(file_path, 'rb') as attachment:
-                part = MIMEBase('application', 'octet-stream')
-                part.set_payload(attachment.read())
+            # Attach file (base64-encoded once, directly into the message)
+            with self._attachment_data(file_path) as data:
+                msg.add_attachment(
+                    data,
+                    maintype='application',
+                    subtype='octet-stream',
+                    filename=file_path.name
+                )
             
-            encoders.encode_base64(part)
-            part.add_header(
-                'Content-Disposition',
-                f'attachment; filename= {file_path.name}'
-            )
-            msg.attach(part)
-            
-            # Send email
-            server = smtplib.SMTP(Config.SMTP_SERVER, Config.SMTP_PORT)
-            server.starttls()
-            server.login(Config.SMTP_USERNAME, Config.SMTP_PASSWORD)
-            text = msg.as_string()
-            server.sendmail(Config.SMTP_USERNAME, recipient, text)
-            server.quit()
+            # Send email over the shared connection
+            with self._lock:
+                try:
+                    server = self._get_connection()
+                    server.send_message(msg, Config.SMTP_USERNAME, [recipient])
+                except smtplib.SMTPServerDisconnected:
+                    self._smtp = None
+                    raise
             
             return {
                 'success': True,
@@ -74,6 +85,57 @@ class EmailDistributor(BaseDistributor):
                 'method': 'email'
             }
     
+    @contextmanager
+    def _attachment_data(self, file_path: Path) -> Iterator[Any]:
+        """
+        Yield a file's contents for attaching.
+        
+        Small files are read into bytes; large ones are exposed as a read-only
+        memory map, so the raw file is never copied into the process before
+        it is base64-encoded.
+        
+        Args:
+            file_path: Path to file to attach
+        
+        Returns:
+            Context manager yielding bytes or a memoryview over the mapping
+        """
+        if file_path.stat().st_size <= self.MMAP_THRESHOLD:
+            yield file_path.read_bytes()
+            return
+        
+        with open(file_path, 'rb') as f, \
+                mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped, \
+                memoryview(mapped) as view:
+            yield view
+    
+    def _get_connection(self) -> smtplib.SMTP:
+        """Return an authenticated SMTP connection, reconnecting if it was dropped."""
+        if self._smtp is not None:
+            try:
+                if self._smtp.noop()[0] == 250:
+                    return self._smtp
+            except (smtplib.SMTPException, OSError):
+                pass
+            self._smtp.close()
+            self._smtp = None
+        
+        server = smtplib.SMTP(Config.SMTP_SERVER, Config.SMTP_PORT)
+        server.starttls()
+        server.login(Config.SMTP_USERNAME, Config.SMTP_PASSWORD)
+        self._smtp = server
+        return server
+    
+    def close(self):
+        """Close the shared SMTP connection."""
+        with self._lock:
+            if self._smtp is not None:
+                try:
+                    self._smtp.quit()
+                except (smtplib.SMTPException, OSError):
+                    self._smtp.close()
+                self._smtp = None
+    
     def get_name(self) -> str:
         return "Email"
 
@@ -1,49 +1,33 @@
 """SMS distributor for sending file links via SMS."""
-from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any
 from twilio.rest import Client
-from .base import BaseDistributor
+from .base import MessageDistributor
 from ..utils.config import Config
 
-class SMSDistributor(BaseDistributor):
+class SMSDistributor(MessageDistributor):
     """Distributor for sending file links via SMS."""
     
     def __init__(self):
         self.client = None
+        self.messaging_service_sid = Config.TWILIO_MESSAGING_SERVICE_SID
         if Config.TWILIO_ACCOUNT_SID and Config.TWILIO_AUTH_TOKEN:
             self.client = Client(Config.TWILIO_ACCOUNT_SID, Config.TWILIO_AUTH_TOKEN)
     
-    def distribute(
-        self,
-        file_path: Path,
-        recipient: str,
-        file_url: Optional[str] = None,
-        message: Optional[str] = None,
-        **kwargs
-    ) -> Dict[str, Any]:
-        """
-        Send file link via SMS.
-        
-        Args:
-            file_path: Path to file (for reference)
-            recipient: Phone number of recipient (E.164 format)
-            file_url: URL to the file (required for SMS)
-            message: Custom message text
-        """
-        if not self.client:
-            raise ValueError("Twilio client not configured. Set credentials in .env file.")
-        
-        if not file_url:
-            raise ValueError("file_url is required for SMS distribution. Upload file first or provide URL.")
-        
+    def _send(self, recipient: str, body: str) -> Dict[str, Any]:
+        """Send a single message, preferring the messaging service when configured."""
         try:
-            body = message or f"Please access this file: {file_url}"
-            
-            message_obj = self.client.messages.create(
-                body=body,
-                from_=Config.TWILIO_PHONE_NUMBER,
-                to=recipient
-            )
+            if self.messaging_service_sid:
+                message_obj = self.client.messages.create(
+                    body=body,
+                    messaging_service_sid=self.messaging_service_sid,
+                    to=recipient
+                )
+            else:
+                message_obj = self.client.messages.create(
+                    body=body,
+                    from_=Config.TWILIO_PHONE_NUMBER,
+                    to=recipient
+                )
             
             return {
                 'success': True,
@@ -56,6 +40,7 @@ class SMSDistributor(BaseDistributor):
             return {
                 'success': False,
                 'error': str(e),
+                'recipient': recipient,
                 'method': 'sms'
             }
     
@@ -1,9 +1,11 @@
 """Web distributor for hosting files locally and providing web links."""
 from pathlib import Path
 from typing import Dict, Any, Optional
-import http.server
-import socketserver
+import os
+import shutil
 import threading
+from functools import partial
+from http.server import ThreadingHTTPServer, SimpleHTTPRequestHandler
 from .base import BaseDistributor
 from ..utils.config import Config
 
@@ -35,10 +37,14 @@ class WebDistributor(BaseDistributor):
         port = port or Config.WEB_HOST_PORT
         Config.ensure_directories()
         
-        # Copy file to hosted directory
+        # Link (or, across filesystems, copy) file into hosted directory
         hosted_path = Config.HOSTED_FILES_DIR / file_path.name
-        import shutil
-        shutil.copy2(file_path, hosted_path)
+        if not (hosted_path.exists() and hosted_path.samefile(file_path)):
+            hosted_path.unlink(missing_ok=True)
+            try:
+                os.link(file_path, hosted_path)
+            except OSError:
+                shutil.copyfile(file_path, hosted_path)
         
         if start_server and not self.server:
             self._start_server(host, port)
@@ -53,12 +59,11 @@ class WebDistributor(BaseDistributor):
         }
     
     def _start_server(self, host: str, port: int):
-        """Start a simple HTTP server to serve files."""
-        class FileHandler(http.server.SimpleHTTPRequestHandler):
-            def __init__(self, *args, **kwargs):
-                super().__init__(*args, directory=str(Config.HOSTED_FILES_DIR), **kwargs)
+        """Start a threaded HTTP server to serve files."""
+        # Resolve the served directory once rather than per request
+        handler = partial(SimpleHTTPRequestHandler, directory=str(Config.HOSTED_FILES_DIR.resolve()))
         
-        self.server = socketserver.TCPServer((host, port), FileHandler)
+        self.server = ThreadingHTTPServer((host, port), handler)
         self.server_thread = threading.Thread(target=self.server.serve_forever, daemon=True)
         self.server_thread.start()
     
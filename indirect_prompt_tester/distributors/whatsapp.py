@@ -1,56 +1,33 @@
 """WhatsApp distributor for sending file links via WhatsApp."""
-from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any
 from twilio.rest import Client
-from .base import BaseDistributor
+from .base import MessageDistributor
 from ..utils.config import Config
 
-class WhatsAppDistributor(BaseDistributor):
+class WhatsAppDistributor(MessageDistributor):
     """Distributor for sending file links via WhatsApp."""
     
     def __init__(self):
         self.client = None
         if Config.TWILIO_ACCOUNT_SID and Config.TWILIO_AUTH_TOKEN:
             self.client = Client(Config.TWILIO_ACCOUNT_SID, Config.TWILIO_AUTH_TOKEN)
-    
-    def distribute(
-        self,
-        file_path: Path,
-        recipient: str,
-        file_url: Optional[str] = None,
-        message: Optional[str] = None,
-        **kwargs
-    ) -> Dict[str, Any]:
-        """
-        Send file link via WhatsApp.
-        
-        Args:
-            file_path: Path to file (for reference)
-            recipient: WhatsApp number (E.164 format with whatsapp: prefix)
-            file_url: URL to the file (required)
-            message: Custom message text
-        """
-        if not self.client:
-            raise ValueError("Twilio client not configured. Set credentials in .env file.")
-        
-        if not file_url:
-            raise ValueError("file_url is required for WhatsApp distribution. Upload file first or provide URL.")
         
+        # Ensure sender has whatsapp: prefix
+        from_number = Config.TWILIO_PHONE_NUMBER
+        if not from_number.startswith('whatsapp:'):
+            from_number = f'whatsapp:{from_number}'
+        self.from_number = from_number
+    
+    def _send(self, recipient: str, body: str) -> Dict[str, Any]:
+        """Send a single WhatsApp message."""
         try:
             # Ensure recipient has whatsapp: prefix
             if not recipient.startswith('whatsapp:'):
                 recipient = f'whatsapp:{recipient}'
             
-            # Ensure sender has whatsapp: prefix
-            from_number = Config.TWILIO_PHONE_NUMBER
-            if not from_number.startswith('whatsapp:'):
-                from_number = f'whatsapp:{from_number}'
-            
-            body = message or f"Please access this file: {file_url}"
-            
             message_obj = self.client.messages.create(
                 body=body,
-                from_=from_number,
+                from_=self.from_number,
                 to=recipient
             )
             
@@ -65,6 +42,7 @@ class WhatsAppDistributor(BaseDistributor):
             return {
                 'success': False,
                 'error': str(e),
+                'recipient': recipient,
                 'method': 'whatsapp'
             }
     
@@ -1,11 +1,18 @@
 """File generators for creating files with embedded indirect prompts."""
+import importlib
+
 from .base import BaseGenerator
-from .image import ImageGenerator
-from .document import DocumentGenerator
-from .video import VideoGenerator
-from .audio import AudioGenerator
-from .web import WebGenerator
-from .syslog import SyslogGenerator
+
+# Generators are imported on first attribute access (PEP 562) so that using
+# one generator does not load moviepy, pydub, python-docx, etc. for the others.
+_GENERATOR_MODULES = {
+    "ImageGenerator": ".image",
+    "DocumentGenerator": ".document",
+    "VideoGenerator": ".video",
+    "AudioGenerator": ".audio",
+    "WebGenerator": ".web",
+    "SyslogGenerator": ".syslog",
+}
 
 __all__ = [
     "BaseGenerator",
@@ -17,3 +24,11 @@ __all__ = [
     "SyslogGenerator",
 ]
 
+def __getattr__(name):
+    if name in _GENERATOR_MODULES:
+        module = importlib.import_module(_GENERATOR_MODULES[name], __name__)
+        return getattr(module, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,25 @@
+"""Shared least-significant-bit embedding for steganography carriers."""
+import numpy as np
+
+
+def embed_lsb(carrier: np.ndarray, payload: bytes) -> int:
+    """
+    Write payload bits (MSB first) into the low bit of each carrier element.
+    
+    The carrier is modified in place, so it should be a uint8 view onto the
+    buffer being written (e.g. one colour channel or the low byte of PCM
+    samples). Bits that do not fit in the carrier are dropped.
+    
+    Args:
+        carrier: One-dimensional uint8 array or view to embed into
+        payload: Bytes to embed
+    
+    Returns:
+        Number of bits written
+    """
+    bits = np.unpackbits(np.frombuffer(payload, dtype=np.uint8))
+    n = min(bits.size, carrier.size)
+    target = carrier[:n]
+    np.bitwise_and(target, 0xFE, out=target)
+    np.bitwise_or(target, bits[:n], out=target)
+    return n
@@ -1,8 +1,11 @@
 """Audio generator for embedding indirect prompts in audio files."""
+import sys
+import wave
 from pathlib import Path
 from typing import Optional
 import numpy as np
 from .base import BaseGenerator
+from ._lsb import embed_lsb
 
 class AudioGenerator(BaseGenerator):
     """Generator for creating audio files with embedded indirect prompts."""
@@ -33,12 +36,9 @@ class AudioGenerator(BaseGenerator):
         self.validate_output_path(output_path)
         
         try:
-            from pydub import AudioSegment
-            from pydub.generators import Sine
-            
             if method == "metadata":
                 # Create a simple tone and embed prompt in metadata
-                tone = Sine(440).to_audio_segment(duration=duration * 1000)
+                tone = self._to_segment(self._sine_samples(duration, sample_rate), sample_rate)
                 tone.export(
                     str(output_path),
                     format=output_path.suffix[1:],
@@ -47,32 +47,26 @@ class AudioGenerator(BaseGenerator):
                 
             elif method == "steganography":
                 # Embed prompt using audio steganography (LSB)
-                tone = Sine(440).to_audio_segment(duration=duration * 1000)
-                # Convert to numpy array for steganography
-                samples = np.array(tone.get_array_of_samples())
-                prompt_bytes = prompt.encode('utf-8')
-                prompt_bits = ''.join(format(byte, '08b') for byte in prompt_bytes)
-                
-                # Embed in least significant bits
-                length_bits = format(len(prompt_bytes), '032b')
-                all_bits = length_bits + prompt_bits
+                samples = self._sine_samples(duration, sample_rate)
                 
-                for i, bit in enumerate(all_bits):
-                    if i < len(samples):
-                        samples[i] = (samples[i] & 0xFFFE) | int(bit)
-                
-                # Convert back to AudioSegment
-                tone = AudioSegment(
-                    samples.tobytes(),
-                    frame_rate=sample_rate,
-                    channels=1,
-                    sample_width=2
+                # Embed the length-prefixed prompt in least significant bits,
+                # working in place on the low byte of each sample
+                low_byte = 0 if sys.byteorder == 'little' else 1
+                embed_lsb(
+                    samples.view(np.uint8)[low_byte::2],
+                    self._length_prefixed_payload(prompt)
                 )
-                tone.export(str(output_path), format=output_path.suffix[1:])
+                
+                if output_path.suffix.lower() == '.wav':
+                    # Write the PCM buffer straight to disk
+                    self._write_wav(output_path, samples, sample_rate)
+                else:
+                    tone = self._to_segment(samples, sample_rate)
+                    tone.export(str(output_path), format=output_path.suffix[1:])
             
             elif method == "speech":
                 # Note: Would require TTS library
-                tone = Sine(440).to_audio_segment(duration=duration * 1000)
+                tone = self._to_segment(self._sine_samples(duration, sample_rate), sample_rate)
                 tone.export(
                     str(output_path),
                     format=output_path.suffix[1:],
@@ -90,6 +84,30 @@ class AudioGenerator(BaseGenerator):
         
         return output_path
     
+    def _sine_samples(self, duration: int, sample_rate: int, frequency: float = 440.0) -> np.ndarray:
+        """Generate a full-scale mono sine tone as int16 samples."""
+        t = np.arange(duration * sample_rate, dtype=np.float64) / sample_rate
+        return (np.sin(2 * np.pi * frequency * t) * 32767).astype(np.int16)
+    
+    def _to_segment(self, samples: np.ndarray, sample_rate: int):
+        """Wrap 16-bit mono samples in a pydub AudioSegment."""
+        from pydub import AudioSegment
+        
+        return AudioSegment(
+            samples.tobytes(),
+            frame_rate=sample_rate,
+            channels=1,
+            sample_width=2
+        )
+    
+    def _write_wav(self, output_path: Path, samples: np.ndarray, sample_rate: int):
+        """Write 16-bit mono samples to a WAV file without going through pydub."""
+        with wave.open(str(output_path), 'wb') as wav_file:
+            wav_file.setnchannels(1)
+            wav_file.setsampwidth(2)
+            wav_file.setframerate(sample_rate)
+            wav_file.writeframes(samples.astype('<i2', copy=False).tobytes())
+    
     def get_supported_formats(self) -> list:
         return self.supported_formats
 
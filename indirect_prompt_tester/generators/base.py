@@ -1,4 +1,5 @@
 """Base generator class for all file generators."""
+import struct
 from abc import ABC, abstractmethod
 from pathlib import Path
 from typing import Optional, Dict, Any
@@ -39,4 +40,9 @@ class BaseGenerator(ABC):
         # Ensure parent directory exists
         output_path.parent.mkdir(parents=True, exist_ok=True)
         return True
-
+    
+    @staticmethod
+    def _length_prefixed_payload(prompt: str) -> bytes:
+        """Encode a prompt as UTF-8 behind a 32-bit big-endian length header."""
+        prompt_bytes = prompt.encode('utf-8')
+        return struct.pack('>I', len(prompt_bytes)) + prompt_bytes
@@ -1,11 +1,41 @@
 """Document generator for embedding indirect prompts in office documents."""
+import io
 from pathlib import Path
 from typing import Optional
 from .base import BaseGenerator
 
+# Office/PDF libraries are imported once at module load; each generator
+# method reports a missing one when it is actually needed
+try:
+    from docx import Document
+except ImportError:
+    Document = None
+
+try:
+    from openpyxl import Workbook
+    from openpyxl.comments import Comment
+except ImportError:
+    Workbook = None
+
+try:
+    from pptx import Presentation
+    from pptx.util import Inches
+except ImportError:
+    Presentation = None
+
+try:
+    from reportlab.lib.pagesizes import letter
+    from reportlab.pdfbase.pdfmetrics import stringWidth
+    from reportlab.pdfgen import canvas
+except ImportError:
+    canvas = None
+
 class DocumentGenerator(BaseGenerator):
     """Generator for creating office documents with embedded indirect prompts."""
     
+    # Serialized blank documents, keyed by doc type, shared across instances
+    _template_bytes = {}
+    
     def __init__(self):
         super().__init__()
         self.supported_formats = ['docx', 'xlsx', 'pptx', 'pdf', 'txt']
@@ -42,12 +72,31 @@ class DocumentGenerator(BaseGenerator):
         else:
             raise ValueError(f"Unsupported document type: {doc_type}")
     
+    @classmethod
+    def _template_stream(cls, doc_type: str, factory) -> io.BytesIO:
+        """
+        Return a fresh stream over a cached blank document.
+        
+        The packaged default template is loaded and serialized once; later
+        documents are opened from the in-memory copy.
+        
+        Args:
+            doc_type: Cache key ('docx' or 'pptx')
+            factory: python-docx Document or python-pptx Presentation
+        """
+        template = cls._template_bytes.get(doc_type)
+        if template is None:
+            buffer = io.BytesIO()
+            factory().save(buffer)
+            template = cls._template_bytes[doc_type] = buffer.getvalue()
+        return io.BytesIO(template)
+    
     def _generate_docx(self, prompt: str, output_path: Path, method: str) -> Path:
         """Generate a Word document."""
-        from docx import Document
-        from docx.shared import Inches
+        if Document is None:
+            raise ImportError("python-docx is required for DOCX generation")
         
-        doc = Document()
+        doc = Document(self._template_stream("docx", Document))
         doc.add_heading('Sample Document', 0)
         doc.add_paragraph('This is a sample document for testing.')
         
@@ -73,8 +122,8 @@ class DocumentGenerator(BaseGenerator):
     
     def _generate_xlsx(self, prompt: str, output_path: Path, method: str) -> Path:
         """Generate an Excel spreadsheet."""
-        from openpyxl import Workbook
-        from openpyxl.comments import Comment
+        if Workbook is None:
+            raise ImportError("openpyxl is required for XLSX generation")
         
         wb = Workbook()
         ws = wb.active
@@ -98,10 +147,10 @@ class DocumentGenerator(BaseGenerator):
     
     def _generate_pptx(self, prompt: str, output_path: Path, method: str) -> Path:
         """Generate a PowerPoint presentation."""
-        from pptx import Presentation
-        from pptx.util import Inches
+        if Presentation is None:
+            raise ImportError("python-pptx is required for PPTX generation")
         
-        prs = Presentation()
+        prs = Presentation(self._template_stream("pptx", Presentation))
         slide = prs.slides.add_slide(prs.slide_layouts[0])
         title = slide.shapes.title
         title.text = "Sample Presentation"
@@ -123,37 +172,7 @@ class DocumentGenerator(BaseGenerator):
     
     def _generate_pdf(self, prompt: str, output_path: Path, method: str) -> Path:
         """Generate a PDF document."""
-        try:
-            from reportlab.lib.pagesizes import letter
-            from reportlab.pdfgen import canvas
-            
-            c = canvas.Canvas(str(output_path), pagesize=letter)
-            width, height = letter
-            
-            c.drawString(100, height - 100, "Sample PDF Document")
-            
-            if method == "visible":
-                # Wrap long prompts
-                y_pos = height - 150
-                words = prompt.split()
-                line = ""
-                for word in words:
-                    test_line = line + " " + word if line else word
-                    if len(test_line) > 80:  # Approximate character limit per line
-                        c.drawString(100, y_pos, line)
-                        y_pos -= 20
-                        line = word
-                    else:
-                        line = test_line
-                if line:
-                    c.drawString(100, y_pos, line)
-            elif method == "hidden":
-                # Embed in metadata
-                c.setTitle("Sample Document")
-                c.setSubject(prompt)
-            
-            c.save()
-        except ImportError:
+        if canvas is None:
             # Fallback: create text file
             content = f"PDF file with embedded prompt: {prompt}\n"
             content += f"Method: {method}\n"
@@ -161,6 +180,42 @@ class DocumentGenerator(BaseGenerator):
             output_path.with_suffix('.txt').write_text(content)
             return output_path.with_suffix('.txt')
         
+        c = canvas.Canvas(str(output_path), pagesize=letter)
+        width, height = letter
+        
+        c.drawString(100, height - 100, "Sample PDF Document")
+        
+        if method == "visible":
+            # Wrap long prompts
+            y_pos = height - 150
+            # Pack words by rendered width in the default font (Helvetica 12)
+            max_width = width - 200
+            space_width = stringWidth(" ", "Helvetica", 12)
+            word_widths = {}
+            line_words = []
+            line_width = 0.0
+            for word in prompt.split():
+                word_width = word_widths.get(word)
+                if word_width is None:
+                    word_width = stringWidth(word, "Helvetica", 12)
+                    word_widths[word] = word_width
+                if line_words and line_width + space_width + word_width > max_width:
+                    c.drawString(100, y_pos, " ".join(line_words))
+                    y_pos -= 20
+                    line_words = [word]
+                    line_width = word_width
+                else:
+                    line_width += space_width + word_width if line_words else word_width
+                    line_words.append(word)
+            if line_words:
+                c.drawString(100, y_pos, " ".join(line_words))
+        elif method == "hidden":
+            # Embed in metadata
+            c.setTitle("Sample Document")
+            c.setSubject(prompt)
+        
+        c.save()
+        
         return output_path
     
     def _generate_txt(self, prompt: str, output_path: Path, method: str) -> Path:
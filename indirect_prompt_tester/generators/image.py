@@ -1,9 +1,20 @@
 """Image generator for embedding indirect prompts in images."""
 from pathlib import Path
-from PIL import Image, ImageDraw, ImageFont
+from PIL import Image, ImageDraw, ImageFont, PngImagePlugin
 import io
+import numpy as np
+from functools import lru_cache
 from typing import Optional
 from .base import BaseGenerator
+from ._lsb import embed_lsb
+
+@lru_cache(maxsize=8)
+def _load_font(size: int):
+    """Load (once per size) the text font, falling back to PIL's default."""
+    try:
+        return ImageFont.truetype("/System/Library/Fonts/Helvetica.ttc", size)
+    except:
+        return ImageFont.load_default()
 
 class ImageGenerator(BaseGenerator):
     """Generator for creating images with embedded indirect prompts."""
@@ -42,11 +53,7 @@ class ImageGenerator(BaseGenerator):
             img = Image.new('RGB', (width, height), color=background_color)
             draw = ImageDraw.Draw(img)
             
-            # Try to use a default font, fallback to basic if not available
-            try:
-                font = ImageFont.truetype("/System/Library/Fonts/Helvetica.ttc", 24)
-            except:
-                font = ImageFont.load_default()
+            font = _load_font(24)
             
             # Wrap text to fit image
             lines = self._wrap_text(prompt, width - 40, font, draw)
@@ -60,9 +67,17 @@ class ImageGenerator(BaseGenerator):
         elif method == "metadata":
             # Embed prompt in image metadata (EXIF)
             img = Image.new('RGB', (width, height), color=background_color)
-            # PIL doesn't directly support custom EXIF, but we can add it to info
-            img.info['comment'] = prompt
-            img.save(output_path)
+            # img.info is ignored on save, so pass the prompt through the
+            # format's own metadata argument
+            suffix = output_path.suffix.lower()
+            if suffix == '.png':
+                pnginfo = PngImagePlugin.PngInfo()
+                pnginfo.add_text('comment', prompt)
+                img.save(output_path, pnginfo=pnginfo)
+            elif suffix == '.gif':
+                img.save(output_path, comment=prompt)
+            else:
+                img.save(output_path, exif=self._prompt_exif(prompt))
             
         elif method == "steganography":
             # Simple steganography: embed in least significant bits
@@ -72,23 +87,54 @@ class ImageGenerator(BaseGenerator):
         
         return output_path
     
+    @staticmethod
+    def _prompt_exif(prompt: str) -> Image.Exif:
+        """
+        Build EXIF data carrying the prompt.
+        
+        ImageDescription is an ASCII tag, so it is only written for ASCII
+        prompts. The full prompt always goes into UserComment (UTF-16 behind
+        the standard UNICODE character-code header) and XPComment, which sits
+        in the main IFD and so also survives in TIFF files.
+        
+        Args:
+            prompt: The prompt to embed
+        
+        Returns:
+            EXIF block to pass to Image.save
+        """
+        exif = Image.Exif()
+        # Little-endian TIFF header, matching the UTF-16-LE comment below
+        exif.endian = '<'
+        if prompt.isascii():
+            exif[0x010E] = prompt  # ImageDescription
+        encoded = prompt.encode('utf-16-le')
+        exif[0x9C9C] = encoded + b'\0\0'  # XPComment
+        exif.get_ifd(0x8769)[0x9286] = b'UNICODE\0' + encoded  # UserComment
+        return exif
+    
     def _wrap_text(self, text: str, max_width: int, font, draw) -> list:
         """Wrap text to fit within max_width."""
         words = text.split()
         lines = []
         current_line = []
+        current_width = 0
+        
+        # Measure each distinct word once and pack lines by summed widths
+        widths = {word: draw.textlength(word, font=font) for word in set(words)}
+        space_width = draw.textlength(' ', font=font)
         
         for word in words:
-            test_line = ' '.join(current_line + [word])
-            bbox = draw.textbbox((0, 0), test_line, font=font)
-            text_width = bbox[2] - bbox[0]
+            text_width = current_width + space_width + widths[word] if current_line else widths[word]
             
             if text_width <= max_width:
                 current_line.append(word)
+                current_width = text_width
             else:
                 if current_line:
                     lines.append(' '.join(current_line))
                 current_line = [word]
+                current_width = widths[word]
         
         if current_line:
             lines.append(' '.join(current_line))
@@ -97,31 +143,12 @@ class ImageGenerator(BaseGenerator):
     
     def _embed_steganography(self, img: Image.Image, prompt: str) -> Image.Image:
         """Embed prompt in image using simple LSB steganography."""
-        pixels = img.load()
-        prompt_bytes = prompt.encode('utf-8')
-        prompt_bits = ''.join(format(byte, '08b') for byte in prompt_bytes)
-        
-        # Add length prefix
-        length_bits = format(len(prompt_bytes), '032b')
-        all_bits = length_bits + prompt_bits
-        
-        width, height = img.size
-        bit_index = 0
+        arr = np.array(img)
         
-        for y in range(height):
-            for x in range(width):
-                if bit_index >= len(all_bits):
-                    return img
-                
-                r, g, b = pixels[x, y]
-                bit = int(all_bits[bit_index])
-                
-                # Modify least significant bit of red channel
-                r = (r & 0xFE) | bit
-                pixels[x, y] = (r, g, b)
-                bit_index += 1
+        # Modify least significant bit of red channel, pixels in row-major order
+        embed_lsb(arr.reshape(-1, 3)[:, 0], self._length_prefixed_payload(prompt))
         
-        return img
+        return Image.fromarray(arr)
     
     def get_supported_formats(self) -> list:
         return self.supported_formats
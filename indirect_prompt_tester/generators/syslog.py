@@ -30,40 +30,43 @@ class SyslogGenerator(BaseGenerator):
         """
         self.validate_output_path(output_path)
         
-        log_entries = []
         log_levels = ['INFO', 'WARNING', 'ERROR', 'DEBUG', 'CRITICAL']
         services = ['auth', 'kernel', 'network', 'systemd', 'apache', 'nginx', 'mysql']
         
+        # All entries share one timestamp; levels and services are drawn in batch
+        # from a local generator rather than the shared module-level one
+        timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        rng = random.Random()
+        levels = rng.choices(log_levels, k=num_entries)
+        picked_services = rng.choices(services, k=num_entries)
+        
         # Generate normal log entries
-        for i in range(num_entries):
-            timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-            level = random.choice(log_levels)
-            service = random.choice(services)
-            message = f"Service {service} completed operation {i+1}"
-            
-            log_entry = f"{timestamp} [{level}] {service}: {message}"
-            log_entries.append(log_entry)
+        log_entries = [
+            f"{timestamp} [{level}] {service}: Service {service} completed operation {i}"
+            for i, level, service in zip(range(1, num_entries + 1), levels, picked_services)
+        ]
         
         # Embed prompt
         if method == "embedded":
             # Embed as a log entry
-            timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
             log_entries.insert(num_entries // 2, f"{timestamp} [INFO] system: {prompt}")
             
         elif method == "hidden":
             # Embed in a comment or encoded format
-            timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
             encoded = prompt.encode('utf-8').hex()
             log_entries.insert(num_entries // 2, f"{timestamp} [DEBUG] system: HEX_DATA={encoded}")
             
         elif method == "encoded":
-            # Embed as base64 or hex in log data
-            timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-            encoded = ' '.join(format(ord(c), '02x') for c in prompt)
+            # Embed as space-separated hex bytes in log data
+            encoded = prompt.encode('utf-8').hex(' ')
             log_entries.insert(num_entries // 2, f"{timestamp} [INFO] parser: data={encoded}")
         
-        # Write log file
-        output_path.write_text('\n'.join(log_entries))
+        # Encode each entry once and write bytes straight to a buffered binary
+        # handle, bypassing the text-layer encoder
+        with output_path.open('wb', buffering=1 << 20) as f:
+            entries = iter(log_entries)
+            f.write(next(entries, '').encode('utf-8'))
+            f.writelines(('\n' + entry).encode('utf-8') for entry in entries)
         return output_path
     
     def get_supported_formats(self) -> list:
@@ -1,9 +1,119 @@
 """Web page generator for embedding indirect prompts in HTML/web pages."""
+import html
+import json
 from pathlib import Path
 from typing import Optional
-from bs4 import BeautifulSoup
 from .base import BaseGenerator
 
+# Complete pages per embedding method. Placeholders take the prompt escaped
+# for where it lands: {text} element text, {attr} attribute value, {comment}
+# HTML comment, {js_comment}/{js_string} script line comment and literal.
+_TMPL_VISIBLE = """<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>Sample Web Page</title>
+</head>
+<body>
+    <h1>Welcome to Our Website</h1>
+    <p>This is a sample web page for testing purposes.</p>
+    <p>{text}</p>
+</body>
+</html>"""
+
+_TMPL_HIDDEN = """<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>Sample Web Page</title>
+</head>
+<body>
+    <!-- {comment} -->
+    <h1>Welcome to Our Website</h1>
+    <p>This is a sample web page for testing purposes.</p>
+    <div style="display: none;">{text}</div>
+</body>
+</html>"""
+
+_TMPL_COMMENTS = """<!DOCTYPE html>
+<html lang="en">
+<!-- {comment} -->
+<head>
+    <!-- {comment} -->
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>Sample Web Page</title>
+</head>
+<body>
+    <!-- {comment} -->
+    <h1>Welcome to Our Website</h1>
+    <p>This is a sample web page for testing purposes.</p>
+</body>
+</html>"""
+
+_TMPL_SCRIPT = """<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>Sample Web Page</title>
+</head>
+<body>
+    <h1>Welcome to Our Website</h1>
+    <p>This is a sample web page for testing purposes.</p>
+    <script>// {js_comment}
+console.log({js_string});</script>
+</body>
+</html>"""
+
+_TMPL_META = """<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>Sample Web Page</title>
+    <meta name="description" content="{attr}">
+    <meta name="keywords" content="{attr}">
+</head>
+<body>
+    <h1>Welcome to Our Website</h1>
+    <p>This is a sample web page for testing purposes.</p>
+</body>
+</html>"""
+
+def _comment_text(prompt: str) -> str:
+    """Make a prompt safe inside an HTML comment, which cannot contain '--'."""
+    text = prompt.replace('--', '- -')
+    if text.endswith('-'):
+        text += ' '
+    return text
+
+def _script_text(text: str) -> str:
+    """Escape '</' so script content cannot close its tag."""
+    return text.replace("</", "<\\/")
+
+# Page builders per embedding method, resolved once at import
+_METHODS = {
+    # Prompt as visible text
+    'visible': lambda prompt: _TMPL_VISIBLE.format(text=html.escape(prompt, quote=False)),
+    # Hidden comment plus a hidden div
+    'hidden': lambda prompt: _TMPL_HIDDEN.format(
+        comment=_comment_text(prompt),
+        text=html.escape(prompt, quote=False)
+    ),
+    # Multiple comment locations
+    'comments': lambda prompt: _TMPL_COMMENTS.format(comment=_comment_text(prompt)),
+    # JavaScript line comment and console.log literal
+    'script': lambda prompt: _TMPL_SCRIPT.format(
+        js_comment=_script_text(" ".join(prompt.splitlines())),
+        js_string=_script_text(json.dumps(prompt))
+    ),
+    # Description and keywords meta tags
+    'meta': lambda prompt: _TMPL_META.format(attr=html.escape(prompt))
+}
+
 class WebGenerator(BaseGenerator):
     """Generator for creating web pages with embedded indirect prompts."""
     
@@ -28,58 +138,12 @@ class WebGenerator(BaseGenerator):
         """
         self.validate_output_path(output_path)
         
-        html_template = """<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Sample Web Page</title>
-</head>
-<body>
-    <h1>Welcome to Our Website</h1>
-    <p>This is a sample web page for testing purposes.</p>
-</body>
-</html>"""
-        
-        soup = BeautifulSoup(html_template, 'html.parser')
+        build_page = _METHODS.get(method)
+        if build_page is None:
+            raise ValueError(f"Unsupported embedding method: {method}")
         
-        if method == "visible":
-            # Add prompt as visible text
-            p = soup.new_tag('p')
-            p.string = prompt
-            soup.body.append(p)
-            
-        elif method == "hidden":
-            # Add as hidden comment
-            comment = soup.new_string(f"<!-- {prompt} -->")
-            soup.body.insert(0, comment)
-            # Also add as hidden div
-            hidden_div = soup.new_tag('div', style='display: none;')
-            hidden_div.string = prompt
-            soup.body.append(hidden_div)
-            
-        elif method == "comments":
-            # Multiple comment locations
-            soup.html.insert(0, soup.new_string(f"<!-- {prompt} -->"))
-            soup.head.insert(0, soup.new_string(f"<!-- {prompt} -->"))
-            soup.body.insert(0, soup.new_string(f"<!-- {prompt} -->"))
-            
-        elif method == "script":
-            # Embed in JavaScript
-            script = soup.new_tag('script')
-            script.string = f"// {prompt}\nconsole.log('{prompt}');"
-            soup.body.append(script)
-            
-        elif method == "meta":
-            # Embed in meta tags
-            meta = soup.new_tag('meta', attrs={'name': 'description', 'content': prompt})
-            soup.head.append(meta)
-            meta2 = soup.new_tag('meta', attrs={'name': 'keywords', 'content': prompt})
-            soup.head.append(meta2)
-        
-        output_path.write_text(str(soup), encoding='utf-8')
+        output_path.write_bytes(build_page(prompt).encode('utf-8'))
         return output_path
     
     def get_supported_formats(self) -> list:
         return self.supported_formats
-
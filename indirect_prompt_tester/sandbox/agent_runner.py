@@ -1,23 +1,87 @@
 """Agent runner for executing and testing agents against files."""
 import subprocess
+import base64
+import hashlib
+import mmap
+import shlex
 import json
+import random
+import sqlite3
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import closing
+from email.utils import parsedate_to_datetime
 from pathlib import Path
 from typing import Dict, Any, Optional, List
 from datetime import datetime
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import NewConnectionError
 import os
 
+from .rate_limit import TokenBucket
 from ..utils.config import Config
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 Config.ensure_directories()
 
+def _dumps(obj: Any, indent: bool = False) -> bytes:
+    """Serialize to UTF-8 JSON bytes, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+    return json.dumps(obj, indent=2 if indent else None).encode('utf-8')
+
+def _loads(data: bytes) -> Any:
+    """Parse JSON bytes, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
 class AgentRunner:
     """Runner for executing agents and monitoring their behavior."""
     
+    # Upper bound on response bodies read from custom endpoints
+    MAX_RESPONSE_BYTES = 10 * 1024 * 1024
+    
+    CACHE_POLICIES = ('enabled', 'read-only', 'replay', 'disabled')
+    # Result fields restored from a cache entry; the rest describe the call
+    CACHED_FIELDS = ('success', 'response', 'error')
+    
+    # Keep-alive connections kept per host; sized above run_batch's worker
+    # count so concurrent calls never discard pooled connections
+    HTTP_POOL_SIZE = 64
+    
+    # Responses retried by _request, and its backoff: factor * 2**attempt
+    # seconds plus up to RETRY_BACKOFF_JITTER of random delay, capped at
+    # RETRY_BACKOFF_MAX (Retry-After takes precedence when sent)
+    RETRY_STATUSES = (429, 500, 502, 503, 504)
+    RETRY_BACKOFF_FACTOR = 1
+    RETRY_BACKOFF_JITTER = 1.0
+    RETRY_BACKOFF_MAX = 30
+    
     def __init__(self):
         self.results_dir = Config.SANDBOX_OUTPUT_DIR
         self.results_dir.mkdir(exist_ok=True)
+        # Shared session so repeated calls reuse pooled TCP/TLS connections
+        self.session = requests.Session()
+        # Retries are handled per call by _request, so the adapter makes
+        # exactly one attempt and each retry can be rate limited
+        adapter = HTTPAdapter(
+            pool_connections=32,
+            pool_maxsize=self.HTTP_POOL_SIZE
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        # Per-provider request/token budgets shared by all calls on this runner
+        self.rate_limiters = {
+            'openai': TokenBucket(Config.OPENAI_RPM, Config.OPENAI_TPM),
+            'anthropic': TokenBucket(Config.ANTHROPIC_RPM, Config.ANTHROPIC_TPM)
+        }
     
     def run_local_agent(
         self,
@@ -50,20 +114,28 @@ class AgentRunner:
         }
         
         try:
-            # Replace placeholder if present
-            cmd = command.format(file_path=str(file_path))
-            cmd_parts = cmd.split()
+            # Split, then replace the placeholder if present, so quoted
+            # arguments and file paths containing spaces stay single arguments
+            cmd_parts = [
+                part.format(file_path=str(file_path))
+                for part in shlex.split(command)
+            ]
             
             start_time = time.time()
             process = subprocess.Popen(
                 cmd_parts,
                 stdout=subprocess.PIPE,
                 stderr=subprocess.PIPE,
-                text=True,
-                timeout=timeout
+                text=True
             )
             
-            stdout, stderr = process.communicate()
+            try:
+                stdout, stderr = process.communicate(timeout=timeout)
+            except subprocess.TimeoutExpired:
+                # Kill the agent and drain its pipes before reporting the timeout
+                process.kill()
+                process.communicate()
+                raise
             execution_time = time.time() - start_time
             
             result.update({
@@ -89,6 +161,7 @@ class AgentRunner:
         api_key: str,
         model: str = "gpt-4",
         prompt: Optional[str] = None,
+        cache_policy: Optional[str] = None,
         **kwargs
     ) -> Dict[str, Any]:
         """
@@ -99,10 +172,15 @@ class AgentRunner:
             api_key: OpenAI API key
             model: Model to use
             prompt: Optional prompt to send with file
+            cache_policy: Response cache policy (defaults to Config.AGENT_CACHE_POLICY)
         
         Returns:
             Dictionary with API response
         """
+        cache_policy, cache_key = self._cache_lookup_key(
+            cache_policy, 'openai', file_path, file_path.suffix.lower(), model, prompt, 1000
+        )
+        
         result = {
             'agent_type': 'openai',
             'file_path': str(file_path),
@@ -112,15 +190,15 @@ class AgentRunner:
             'response': '',
             'error': ''
         }
+        cached = self._load_cached(cache_key, cache_policy)
+        if cached is not None:
+            result.update(cached)
+            return result
         
         try:
-            # Read file content
-            file_content = file_path.read_bytes()
-            
             # For images, use vision API
             if file_path.suffix.lower() in ['.png', '.jpg', '.jpeg', '.gif', '.webp']:
-                import base64
-                base64_image = base64.b64encode(file_content).decode('utf-8')
+                base64_image = self._b64encode_file(file_path)
                 
                 headers = {
                     "Authorization": f"Bearer {api_key}",
@@ -149,10 +227,13 @@ class AgentRunner:
                     "max_tokens": 1000
                 }
                 
-                response = requests.post(
+                response = self._request(
+                    'openai',
+                    self._estimate_tokens(prompt or '', 1000),
+                    "POST",
                     "https://api.openai.com/v1/chat/completions",
                     headers=headers,
-                    json=payload,
+                    data=_dumps(payload),
                     timeout=60
                 )
                 
@@ -164,8 +245,6 @@ class AgentRunner:
             
             else:
                 # For text files, use text API
-                file_text = file_path.read_text(encoding='utf-8', errors='ignore')
-                
                 headers = {
                     "Authorization": f"Bearer {api_key}",
                     "Content-Type": "application/json"
@@ -176,13 +255,16 @@ class AgentRunner:
                     "messages": [
                         {
                             "role": "user",
-                            "content": prompt or f"Process this file:\n\n{file_text[:4000]}"
+                            "content": prompt or f"Process this file:\n\n{self._read_text_prefix(file_path, 4000)}"
                         }
                     ],
                     "max_tokens": 1000
                 }
                 
-                response = requests.post(
+                response = self._request(
+                    'openai',
+                    self._estimate_tokens(payload['messages'][0]['content'], 1000),
+                    "POST",
                     "https://api.openai.com/v1/chat/completions",
                     headers=headers,
                     json=payload,
@@ -198,6 +280,7 @@ class AgentRunner:
         except Exception as e:
             result['error'] = str(e)
         
+        self._store_cached(cache_key, result, cache_policy)
         return result
     
     def run_anthropic_agent(
@@ -206,6 +289,7 @@ class AgentRunner:
         api_key: str,
         model: str = "claude-3-opus-20240229",
         prompt: Optional[str] = None,
+        cache_policy: Optional[str] = None,
         **kwargs
     ) -> Dict[str, Any]:
         """
@@ -216,10 +300,13 @@ class AgentRunner:
             api_key: Anthropic API key
             model: Model to use
             prompt: Optional prompt to send with file
+            cache_policy: Response cache policy (defaults to Config.AGENT_CACHE_POLICY)
         
         Returns:
             Dictionary with API response
         """
+        cache_policy, cache_key = self._cache_lookup_key(cache_policy, 'anthropic', file_path, model, prompt, 1000)
+        
         result = {
             'agent_type': 'anthropic',
             'file_path': str(file_path),
@@ -229,10 +316,12 @@ class AgentRunner:
             'response': '',
             'error': ''
         }
+        cached = self._load_cached(cache_key, cache_policy)
+        if cached is not None:
+            result.update(cached)
+            return result
         
         try:
-            file_text = file_path.read_text(encoding='utf-8', errors='ignore')
-            
             headers = {
                 "x-api-key": api_key,
                 "anthropic-version": "2023-06-01",
@@ -245,12 +334,15 @@ class AgentRunner:
                 "messages": [
                     {
                         "role": "user",
-                        "content": prompt or f"Process this file:\n\n{file_text[:4000]}"
+                        "content": prompt or f"Process this file:\n\n{self._read_text_prefix(file_path, 4000)}"
                     }
                 ]
             }
             
-            response = requests.post(
+            response = self._request(
+                'anthropic',
+                self._estimate_tokens(payload['messages'][0]['content'], 1000),
+                "POST",
                 "https://api.anthropic.com/v1/messages",
                 headers=headers,
                 json=payload,
@@ -266,6 +358,7 @@ class AgentRunner:
         except Exception as e:
             result['error'] = str(e)
         
+        self._store_cached(cache_key, result, cache_policy)
         return result
     
     def run_custom_api_agent(
@@ -274,6 +367,7 @@ class AgentRunner:
         endpoint: str,
         api_key: Optional[str] = None,
         method: str = "POST",
+        cache_policy: Optional[str] = None,
         **kwargs
     ) -> Dict[str, Any]:
         """
@@ -284,10 +378,13 @@ class AgentRunner:
             endpoint: API endpoint URL
             api_key: Optional API key
             method: HTTP method
+            cache_policy: Response cache policy (defaults to Config.AGENT_CACHE_POLICY)
         
         Returns:
             Dictionary with API response
         """
+        cache_policy, cache_key = self._cache_lookup_key(cache_policy, 'custom_api', file_path, endpoint, method.upper())
+        
         result = {
             'agent_type': 'custom_api',
             'file_path': str(file_path),
@@ -297,9 +394,13 @@ class AgentRunner:
             'response': '',
             'error': ''
         }
+        cached = self._load_cached(cache_key, cache_policy)
+        if cached is not None:
+            result.update(cached)
+            return result
         
         try:
-            file_content = file_path.read_bytes()
+            file_content = self._read_all(file_path)
             
             headers = {}
             if api_key:
@@ -307,36 +408,366 @@ class AgentRunner:
             
             if method.upper() == "POST":
                 files = {'file': (file_path.name, file_content)}
-                response = requests.post(endpoint, files=files, headers=headers, timeout=60)
+                response = self._request(None, 0, "POST", endpoint, files=files, headers=headers, timeout=60, stream=True)
             else:
-                response = requests.get(endpoint, headers=headers, timeout=60)
+                response = self._request(None, 0, "GET", endpoint, headers=headers, timeout=60, stream=True)
             
-            if response.status_code in [200, 201]:
+            body = self._read_capped(response)
+            if body is None:
+                result['error'] = f"Response exceeded {self.MAX_RESPONSE_BYTES} bytes"
+            elif response.status_code in [200, 201]:
                 result['success'] = True
-                result['response'] = response.text
+                result['response'] = body
             else:
-                result['error'] = f"API error: {response.status_code} - {response.text}"
+                result['error'] = f"API error: {response.status_code} - {body}"
         
         except Exception as e:
             result['error'] = str(e)
         
+        self._store_cached(cache_key, result, cache_policy)
         return result
     
+    def run_batch(
+        self,
+        agent_type: str,
+        file_paths: List[Path],
+        max_workers: Optional[int] = None,
+        **kwargs
+    ) -> List[Dict[str, Any]]:
+        """
+        Test several files against one agent concurrently.
+        
+        Agent calls are I/O bound, so they run on a thread pool sharing the
+        runner's HTTP session. Local agents are separate processes; each worker
+        thread just waits on its process, so they run in parallel too.
+        
+        Args:
+            agent_type: Agent to run ('local', 'openai', 'anthropic', 'custom_api')
+            file_paths: Files to test
+            max_workers: Maximum number of concurrent calls (defaults to the
+                CPU count for local agents and 8 for API agents)
+            **kwargs: Arguments passed to the matching run_*_agent method
+        
+        Returns:
+            List of result dictionaries, in the same order as file_paths
+        """
+        run_agent = getattr(self, f"run_{agent_type}_agent", None)
+        if run_agent is None:
+            raise ValueError(f"Unsupported agent type: {agent_type}")
+        
+        if max_workers is None:
+            max_workers = (os.cpu_count() or 1) if agent_type == 'local' else 8
+        
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(lambda path: run_agent(file_path=path, **kwargs), file_paths))
+    
+    def _request(
+        self,
+        provider: Optional[str],
+        tokens: int,
+        method: str,
+        url: str,
+        **kwargs
+    ) -> requests.Response:
+        """
+        Send a request, retrying transient failures.
+        
+        Connection failures (nothing was sent) and 429/5xx responses are
+        retried up to Config.AGENT_MAX_RETRIES times with jittered exponential
+        backoff, honouring Retry-After (a response asking for more than
+        RETRY_BACKOFF_MAX seconds is returned as is). Read timeouts are never
+        retried: the provider may already have processed, and billed, the
+        request. Every attempt, retries included, is charged to the provider's
+        rate limiter.
+        
+        Args:
+            provider: Rate limiter to charge ('openai', 'anthropic'), or None
+            tokens: Estimated tokens per attempt
+            method: HTTP method
+            url: Request URL
+            **kwargs: Arguments passed to requests.Session.request
+        
+        Returns:
+            The last response received
+        """
+        limiter = self.rate_limiters.get(provider)
+        attempt = 0
+        while True:
+            if limiter is not None:
+                limiter.acquire(tokens)
+            try:
+                response = self.session.request(method, url, **kwargs)
+            except requests.RequestException as e:
+                if attempt >= Config.AGENT_MAX_RETRIES or not self._is_connect_failure(e):
+                    raise
+                delay = self._backoff(attempt)
+            else:
+                if attempt >= Config.AGENT_MAX_RETRIES or response.status_code not in self.RETRY_STATUSES:
+                    return response
+                delay = self._retry_after(response)
+                if delay is None:
+                    delay = self._backoff(attempt)
+                elif delay > self.RETRY_BACKOFF_MAX:
+                    # The server wants a longer wait than we allow; give up
+                    return response
+                response.close()
+            time.sleep(delay)
+            attempt += 1
+    
+    @staticmethod
+    def _is_connect_failure(error: requests.RequestException) -> bool:
+        """True for errors raised before the request was sent, which are safe to retry."""
+        if isinstance(error, requests.exceptions.ConnectTimeout):
+            return True
+        reason = getattr(error.args[0], 'reason', None) if error.args else None
+        return isinstance(error, requests.ConnectionError) and isinstance(reason, NewConnectionError)
+    
+    def _backoff(self, attempt: int) -> float:
+        """Delay before retry number attempt + 1."""
+        delay = min(self.RETRY_BACKOFF_MAX, self.RETRY_BACKOFF_FACTOR * 2 ** attempt)
+        return delay + random.uniform(0, self.RETRY_BACKOFF_JITTER)
+    
+    @staticmethod
+    def _retry_after(response: requests.Response) -> Optional[float]:
+        """Seconds requested by a Retry-After header (delta or HTTP date), if any."""
+        value = response.headers.get('Retry-After')
+        if not value:
+            return None
+        value = value.strip()
+        if value.isdigit():
+            return float(value)
+        try:
+            retry_at = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        return max(0.0, retry_at.timestamp() - time.time())
+    
+    @staticmethod
+    def _read_all(file_path: Path) -> bytes:
+        """Read a whole file with raw os.read calls, skipping the buffered reader."""
+        fd = os.open(file_path, os.O_RDONLY)
+        try:
+            size = os.fstat(fd).st_size
+            chunks = []
+            while True:
+                # A single read can return short (e.g. the ~2 GiB cap on Linux)
+                chunk = os.read(fd, max(size, 65536))
+                if not chunk:
+                    break
+                chunks.append(chunk)
+            return b"".join(chunks)
+        finally:
+            os.close(fd)
+    
+    @staticmethod
+    def _read_text_prefix(file_path: Path, limit: int) -> str:
+        """
+        Decode only as much of a file as needed for its first `limit` characters.
+        
+        Text mode skips undecodable bytes and translates \\r\\n and \\r line
+        endings to \\n before counting, so the result matches read_text()
+        with errors='ignore' followed by slicing.
+        """
+        with open(file_path, 'r', encoding='utf-8', errors='ignore', newline=None) as f:
+            return f.read(limit)
+    
+    @staticmethod
+    def _b64encode_file(file_path: Path) -> str:
+        """Base64-encode a file straight from a read-only memory map."""
+        with open(file_path, 'rb') as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return ''
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                return base64.b64encode(mapped).decode('ascii')
+    
+    @staticmethod
+    def _estimate_tokens(text: str, max_tokens: int) -> int:
+        """Rough token estimate for rate limiting: ~4 characters per token plus the completion budget."""
+        return len(text) // 4 + max_tokens
+    
+    def _cache_lookup_key(
+        self,
+        cache_policy: Optional[str],
+        provider: str,
+        file_path: Path,
+        *params
+    ) -> tuple:
+        """
+        Resolve the cache policy and derive the cache key for a call.
+        
+        The key is a SHA-256 over the provider, file contents and request
+        parameters, and is only computed when the cache is in use.
+        
+        Returns:
+            Tuple of (policy, key); key is None when caching is disabled or
+            the file cannot be read
+        """
+        cache_policy = cache_policy or Config.AGENT_CACHE_POLICY
+        if cache_policy not in self.CACHE_POLICIES:
+            raise ValueError(f"Unsupported cache policy: {cache_policy}")
+        if cache_policy == 'disabled':
+            return cache_policy, None
+        
+        digest = hashlib.sha256(provider.encode('utf-8'))
+        try:
+            digest.update(self._read_all(file_path))
+        except OSError:
+            # Let the agent call report the unreadable file
+            return cache_policy, None
+        for param in params:
+            digest.update(b'\0' + str(param).encode('utf-8'))
+        return cache_policy, digest.hexdigest()
+    
+    def _load_cached(self, cache_key: Optional[str], cache_policy: str) -> Optional[Dict[str, Any]]:
+        """
+        Look up a cached response.
+        
+        Only the response fields are returned, so the caller's result keeps
+        its own file path and timestamp. Missing and unreadable entries are
+        both misses, as is a file that could not be hashed (no key).
+        
+        Returns:
+            Dictionary of success/response/error fields; None on a miss, except
+            in replay mode, where a miss yields failed fields instead of a
+            live call
+        """
+        if cache_policy == 'disabled':
+            return None
+        
+        fields = None
+        if cache_key is not None:
+            cache_path = Config.AGENT_CACHE_DIR / f"{cache_key}.json"
+            try:
+                cached = _loads(cache_path.read_bytes())
+                fields = {name: cached[name] for name in self.CACHED_FIELDS}
+            except (OSError, ValueError, TypeError, KeyError):
+                pass
+        
+        if fields is not None:
+            fields['cached'] = True
+            return fields
+        if cache_policy == 'replay':
+            return {
+                'success': False,
+                'response': '',
+                'error': "No cached response in replay mode",
+                'cached': False
+            }
+        return None
+    
+    def _store_cached(self, cache_key: Optional[str], result: Dict[str, Any], cache_policy: str):
+        """Write a successful result to the cache when the policy allows it."""
+        if cache_key is None or cache_policy != 'enabled' or not result['success']:
+            return
+        Config.AGENT_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        cache_path = Config.AGENT_CACHE_DIR / f"{cache_key}.json"
+        # Write to a temporary file and rename so readers never see a partial entry
+        tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        tmp_path.write_bytes(_dumps(result))
+        os.replace(tmp_path, cache_path)
+    
+    def _read_capped(self, response: requests.Response) -> Optional[str]:
+        """Read a streamed response body, or return None if it exceeds MAX_RESPONSE_BYTES."""
+        chunks = []
+        size = 0
+        with response:
+            for chunk in response.iter_content(chunk_size=65536):
+                size += len(chunk)
+                if size > self.MAX_RESPONSE_BYTES:
+                    return None
+                chunks.append(chunk)
+        return b"".join(chunks).decode(response.encoding or 'utf-8', errors='replace')
+    
     def save_result(self, result: Dict[str, Any]) -> Path:
-        """Save test result to file."""
+        """Save test result to file and record it in the results index."""
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         result_file = self.results_dir / f"result_{timestamp}.json"
-        result_file.write_text(json.dumps(result, indent=2))
+        result_file.write_bytes(_dumps(result, indent=True))
+        with closing(self._open_index()) as conn, conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO result_files VALUES (?, ?, ?, ?, ?)",
+                self._index_row(result_file.name, result_file.stat().st_mtime_ns, result)
+            )
         return result_file
     
-    def load_results(self) -> List[Dict[str, Any]]:
-        """Load all saved results."""
-        results = []
-        for result_file in self.results_dir.glob("result_*.json"):
-            try:
-                result = json.loads(result_file.read_text())
-                results.append(result)
-            except:
-                pass
-        return sorted(results, key=lambda x: x.get('timestamp', ''), reverse=True)
-
+    def load_results(
+        self,
+        agent_type: Optional[str] = None,
+        max_workers: int = 32
+    ) -> List[Dict[str, Any]]:
+        """
+        Load all saved results, newest first.
+        
+        The JSON files are the only copy of each result; a SQLite index in
+        the results directory holds just their metadata (timestamp, agent
+        type, tested file) for ordering and filtering. Only files that are
+        new or changed since the last load are parsed to refresh the index,
+        entries for deleted files are dropped, and the selected files are
+        then read on a thread pool.
+        
+        Args:
+            agent_type: Only return results from this agent type
+            max_workers: Maximum number of concurrent file reads
+        """
+        with closing(self._open_index()) as conn:
+            indexed = dict(conn.execute("SELECT name, mtime_ns FROM result_files"))
+            on_disk = {
+                entry.name: entry.stat().st_mtime_ns
+                for entry in os.scandir(self.results_dir)
+                if entry.name.startswith("result_") and entry.name.endswith(".json")
+            }
+            stale = [name for name, mtime_ns in on_disk.items() if indexed.get(name) != mtime_ns]
+            
+            with conn:
+                conn.executemany(
+                    "DELETE FROM result_files WHERE name = ?",
+                    ((name,) for name in indexed.keys() - on_disk.keys())
+                )
+                if stale:
+                    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                        rows = [
+                            self._index_row(name, on_disk[name], result)
+                            for name, result in zip(stale, executor.map(self._load_result_file, stale))
+                            if result is not None
+                        ]
+                    conn.executemany("INSERT OR REPLACE INTO result_files VALUES (?, ?, ?, ?, ?)", rows)
+            
+            if agent_type is None:
+                cursor = conn.execute("SELECT name FROM result_files ORDER BY ts DESC")
+            else:
+                cursor = conn.execute(
+                    "SELECT name FROM result_files WHERE agent_type = ? ORDER BY ts DESC",
+                    (agent_type,)
+                )
+            names = [name for (name,) in cursor]
+        
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return [result for result in executor.map(self._load_result_file, names) if result is not None]
+    
+    def _open_index(self) -> sqlite3.Connection:
+        """Open (creating if needed) the SQLite index of saved results."""
+        conn = sqlite3.connect(self.results_dir / "results_index.db", timeout=30)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        # Older indexes kept a full copy of every result; drop it and reclaim the space
+        if conn.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'results'").fetchone():
+            conn.execute("DROP TABLE results")
+            conn.execute("VACUUM")
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS result_files ("
+            "name TEXT PRIMARY KEY, mtime_ns INTEGER, ts TEXT, agent_type TEXT, file_path TEXT)"
+        )
+        conn.execute("CREATE INDEX IF NOT EXISTS result_files_ts ON result_files (ts)")
+        return conn
+    
+    @staticmethod
+    def _index_row(name: str, mtime_ns: int, result: Dict[str, Any]) -> tuple:
+        """Build the index row (metadata only) for a saved result file."""
+        return (name, mtime_ns, result.get('timestamp', ''), result.get('agent_type'), result.get('file_path'))
+    
+    def _load_result_file(self, name: str) -> Optional[Dict[str, Any]]:
+        """Read and parse one result file, returning None if it is missing or invalid."""
+        try:
+            return _loads((self.results_dir / name).read_bytes())
+        except (OSError, ValueError):
+            return None
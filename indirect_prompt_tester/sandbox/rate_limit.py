@@ -0,0 +1,64 @@
+"""Client-side rate limiting for provider API calls."""
+import threading
+import time
+
+
+class TokenBucket:
+    """
+    Thread-safe limiter on requests per minute and tokens per minute.
+    
+    Both budgets refill continuously. A limit of 0 disables that budget.
+    """
+    
+    def __init__(self, requests_per_minute: int = 0, tokens_per_minute: int = 0):
+        self.requests_per_minute = requests_per_minute
+        self.tokens_per_minute = tokens_per_minute
+        self.request_tokens = float(requests_per_minute)
+        self.token_tokens = float(tokens_per_minute)
+        self.last_update = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def acquire(self, tokens: int = 0):
+        """
+        Block until one request and the estimated tokens fit in the budget.
+        
+        Args:
+            tokens: Estimated tokens the request will consume
+        """
+        if not self.requests_per_minute and not self.tokens_per_minute:
+            return
+        
+        # A single request larger than the whole budget waits for a full bucket
+        tokens = min(tokens, self.tokens_per_minute)
+        while True:
+            with self._lock:
+                self._refill()
+                wait = max(
+                    self._wait_for(self.request_tokens, 1, self.requests_per_minute),
+                    self._wait_for(self.token_tokens, tokens, self.tokens_per_minute)
+                )
+                if wait == 0:
+                    self.request_tokens -= 1
+                    self.token_tokens -= tokens
+                    return
+            time.sleep(wait)
+    
+    def _refill(self):
+        now = time.monotonic()
+        elapsed = now - self.last_update
+        self.last_update = now
+        self.request_tokens = min(
+            self.requests_per_minute,
+            self.request_tokens + elapsed * self.requests_per_minute / 60
+        )
+        self.token_tokens = min(
+            self.tokens_per_minute,
+            self.token_tokens + elapsed * self.tokens_per_minute / 60
+        )
+    
+    @staticmethod
+    def _wait_for(available: float, needed: float, per_minute: int) -> float:
+        """Seconds until `needed` units are available (0 if unlimited or ready)."""
+        if not per_minute or available >= needed:
+            return 0
+        return (needed - available) * 60 / per_minute
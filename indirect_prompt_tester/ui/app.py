@@ -1,19 +1,16 @@
 """Streamlit UI application."""
 import streamlit as st
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 import pandas as pd
 from typing import Optional
 
-from indirect_prompt_tester.generators import (
-    ImageGenerator, DocumentGenerator, VideoGenerator,
-    AudioGenerator, WebGenerator, SyslogGenerator
-)
-from indirect_prompt_tester.distributors import (
-    S3Distributor, EmailDistributor, SMSDistributor,
-    WhatsAppDistributor, WebDistributor
-)
+from indirect_prompt_tester import generators
+from indirect_prompt_tester import distributors
 from indirect_prompt_tester.utils.config import Config
-from indirect_prompt_tester.utils.prompts import get_random_prompt, get_all_prompts
+from indirect_prompt_tester.utils.prompts import (
+    EXAMPLE_PROMPT_PREVIEWS, get_random_prompt, get_all_prompts
+)
 from indirect_prompt_tester.sandbox.agent_runner import AgentRunner
 from indirect_prompt_tester.sandbox.monitor import SandboxMonitor
 
@@ -25,14 +22,83 @@ st.set_page_config(
     layout="wide"
 )
 
+# File type -> generator class name; the generators package imports each
+# backend (moviepy, pydub, python-docx, ...) only when its class is first used
+_GENERATORS = {
+    "image": "ImageGenerator",
+    "document": "DocumentGenerator",
+    "video": "VideoGenerator",
+    "audio": "AudioGenerator",
+    "web": "WebGenerator",
+    "syslog": "SyslogGenerator"
+}
+
+# Distribution method -> (distributor class name, display name)
+_DISTRIBUTORS = {
+    "web": ("WebDistributor", "Web Hosting"),
+    "s3": ("S3Distributor", "S3"),
+    "email": ("EmailDistributor", "Email"),
+    "sms": ("SMSDistributor", "SMS"),
+    "whatsapp": ("WhatsAppDistributor", "WhatsApp")
+}
+
+RISK_EMOJI = {
+    'high': '🔴',
+    'medium': '🟡',
+    'low': '🟢'
+}
+# Full "Risk Level" metric values, built once
+RISK_LABELS = {level: f"{emoji} {level.upper()}" for level, emoji in RISK_EMOJI.items()}
+
+@st.cache_resource
+def get_generator(file_type: str):
+    """Return the generator for a file type, shared across reruns and sessions."""
+    return getattr(generators, _GENERATORS[file_type])()
+
+@st.cache_resource
+def get_distributor(method: str):
+    """Return the distributor for a method, keeping its client (boto3, Twilio, SMTP) alive across reruns."""
+    return getattr(distributors, _DISTRIBUTORS[method][0])()
+
+@st.cache_data(ttl=5)
+def list_generated_files(dir_mtime: float) -> list:
+    """List generated files; keyed on the directory mtime so new files show up."""
+    return list(Config.GENERATED_FILES_DIR.glob("*"))
+
+@st.cache_resource
+def get_runner() -> AgentRunner:
+    """Return the shared agent runner (and its pooled HTTP session)."""
+    return AgentRunner()
+
+@st.cache_resource
+def get_monitor() -> SandboxMonitor:
+    """Return the shared sandbox monitor (and its analysis cache)."""
+    return SandboxMonitor()
+
+@st.cache_data(ttl=5)
+def load_saved_results() -> list:
+    """Load saved results, reusing the last load for a few seconds across reruns."""
+    return get_runner().load_results()
+
+# Fragments rerun only their own block on widget changes; st.fragment needs
+# Streamlit 1.37+, so fall back to experimental_fragment or a plain function
+_fragment = (
+    getattr(st, "fragment", None)
+    or getattr(st, "experimental_fragment", None)
+    or (lambda func: func)
+)
+
 def main():
     st.title("🔒 Indirect Prompt Tester Framework")
     st.markdown("Generate and test files with embedded indirect prompts")
     
-    # Sidebar navigation
+    # Sidebar navigation; the selected page lives in session state, and each
+    # page body is a fragment, so only navigation reruns the whole script
+    st.session_state.setdefault("page", "File Generator")
     page = st.sidebar.selectbox(
         "Navigation",
-        ["File Generator", "Distribution", "Sandbox", "Settings"]
+        ["File Generator", "Distribution", "Sandbox", "Settings"],
+        key="page"
     )
     
     if page == "File Generator":
@@ -44,6 +110,7 @@ def main():
     elif page == "Settings":
         show_settings()
 
+@_fragment
 def show_file_generator():
     st.header("📄 File Generator")
     
@@ -70,12 +137,14 @@ def show_file_generator():
             selected_idx = st.selectbox(
                 "Select Example Prompt",
                 range(len(example_prompts)),
-                format_func=lambda x: example_prompts[x][:50] + "..."
+                format_func=EXAMPLE_PROMPT_PREVIEWS.__getitem__
             )
             prompt = example_prompts[selected_idx]
             st.text_area("Selected Prompt", prompt, height=100, disabled=True)
     
-    with col2:
+    # Output options are batched in a form so typing into them does not rerun
+    # the page; only the Generate button submits them
+    with col2, st.form("gen_form"):
         output_name = st.text_input("Output Filename", value="test_file")
         
         if file_type == "image":
@@ -96,41 +165,40 @@ def show_file_generator():
         elif file_type == "syslog":
             method = st.selectbox("Embedding Method", ["embedded", "hidden", "encoded"])
             num_entries = st.number_input("Number of Log Entries", min_value=10, max_value=1000, value=100)
+        
+        submitted = st.form_submit_button("Generate File", type="primary")
     
-    if st.button("Generate File", type="primary"):
+    if submitted:
         if not prompt:
             st.error("Please provide a prompt")
             return
         
         try:
             output_path = Config.GENERATED_FILES_DIR / output_name
+            generator = get_generator(file_type)
             
             if file_type == "image":
-                generator = ImageGenerator()
                 generator.generate(prompt, output_path, method=method, width=width, height=height)
             elif file_type == "document":
-                generator = DocumentGenerator()
                 generator.generate(prompt, output_path, doc_type=doc_format, method=method)
             elif file_type == "video":
-                generator = VideoGenerator()
                 generator.generate(prompt, output_path, method=method, duration=duration)
             elif file_type == "audio":
-                generator = AudioGenerator()
                 generator.generate(prompt, output_path, method=method, duration=duration)
             elif file_type == "web":
-                generator = WebGenerator()
                 generator.generate(prompt, output_path, method=method)
             elif file_type == "syslog":
-                generator = SyslogGenerator()
                 generator.generate(prompt, output_path, method=method, num_entries=num_entries)
             
             st.success(f"✓ File generated: {output_path}")
-            st.download_button(
-                "Download File",
-                data=output_path.read_bytes(),
-                file_name=output_path.name,
-                mime="application/octet-stream"
-            )
+            # Hand Streamlit the open file rather than a bytes copy of it
+            with output_path.open("rb") as generated_file:
+                st.download_button(
+                    "Download File",
+                    data=generated_file,
+                    file_name=output_path.name,
+                    mime="application/octet-stream"
+                )
             
             # Store in session state for distribution
             st.session_state['last_generated_file'] = str(output_path)
@@ -139,6 +207,7 @@ def show_file_generator():
         except Exception as e:
             st.error(f"Error generating file: {e}")
 
+@_fragment
 def show_distribution():
     st.header("📤 File Distribution")
     
@@ -154,78 +223,105 @@ def show_distribution():
         st.warning("Please generate a file first or provide a valid file path")
         return
     
-    distribution_method = st.selectbox(
-        "Distribution Method",
-        ["web", "s3", "email", "sms", "whatsapp"]
+    distribution_methods = st.multiselect(
+        "Distribution Methods",
+        list(_DISTRIBUTORS),
+        default=["web"],
+        format_func=lambda m: _DISTRIBUTORS[m][1]
     )
     
-    if distribution_method == "web":
-        if st.button("Host File", type="primary"):
-            try:
-                distributor = WebDistributor()
-                result = distributor.distribute(Path(file_path))
-                if result.get('success'):
-                    st.success(f"✓ File hosted at: {result['url']}")
-                    st.code(result['url'])
-            except Exception as e:
-                st.error(f"Error: {e}")
+    # Collect the options for each selected destination
+    targets = {}
     
-    elif distribution_method == "s3":
+    if "s3" in distribution_methods:
+        st.subheader("S3")
         bucket = st.text_input("S3 Bucket (optional)", value=Config.AWS_S3_BUCKET)
         public = st.checkbox("Make Public")
-        if st.button("Upload to S3", type="primary"):
-            try:
-                distributor = S3Distributor()
-                result = distributor.distribute(Path(file_path), bucket=bucket, public=public)
-                if result.get('success'):
-                    st.success(f"✓ File uploaded to S3")
-                    st.code(result['url'])
-                else:
-                    st.error(f"Error: {result.get('error')}")
-            except Exception as e:
-                st.error(f"Error: {e}")
+        concurrency = st.number_input("Parallel Upload Parts", min_value=1, max_value=32, value=8)
+        targets["s3"] = {
+            'bucket': bucket,
+            'public': public,
+            'max_concurrency': int(concurrency)
+        }
     
-    elif distribution_method == "email":
+    if "email" in distribution_methods:
+        st.subheader("Email")
         recipient = st.text_input("Recipient Email")
         subject = st.text_input("Subject (optional)")
         body = st.text_area("Body (optional)")
-        if st.button("Send Email", type="primary"):
-            try:
-                distributor = EmailDistributor()
-                result = distributor.distribute(Path(file_path), recipient=recipient, subject=subject, body=body)
-                if result.get('success'):
-                    st.success(f"✓ Email sent to {recipient}")
-                else:
-                    st.error(f"Error: {result.get('error')}")
-            except Exception as e:
-                st.error(f"Error: {e}")
-    
-    elif distribution_method in ["sms", "whatsapp"]:
-        recipient = st.text_input("Recipient Phone Number (E.164 format)")
-        file_url = st.text_input("File URL (required)")
-        message = st.text_area("Message (optional)")
-        if st.button(f"Send via {distribution_method.upper()}", type="primary"):
-            try:
-                if distribution_method == "sms":
-                    distributor = SMSDistributor()
-                else:
-                    distributor = WhatsAppDistributor()
-                result = distributor.distribute(Path(file_path), recipient=recipient, file_url=file_url, message=message)
-                if result.get('success'):
-                    st.success(f"✓ Message sent to {recipient}")
+        targets["email"] = {'recipient': recipient, 'subject': subject, 'body': body}
+    
+    for method in ("sms", "whatsapp"):
+        if method in distribution_methods:
+            st.subheader(_DISTRIBUTORS[method][1])
+            recipient = st.text_input("Recipient Phone Number (E.164 format)", key=f"{method}_recipient")
+            file_url = st.text_input("File URL (required)", key=f"{method}_file_url")
+            message = st.text_area("Message (optional)", key=f"{method}_message")
+            targets[method] = {'recipient': recipient, 'file_url': file_url, 'message': message}
+    
+    if "web" in distribution_methods:
+        targets["web"] = {}
+    
+    if st.button("Distribute", type="primary", disabled=not targets):
+        with st.spinner("Distributing..."):
+            results = distribute_many(Path(file_path), targets)
+        
+        for method, result in results:
+            label = _DISTRIBUTORS[method][1]
+            if result.get('success'):
+                if result.get('recipient'):
+                    st.success(f"✓ {label}: sent to {result['recipient']}")
                 else:
-                    st.error(f"Error: {result.get('error')}")
-            except Exception as e:
-                st.error(f"Error: {e}")
+                    st.success(f"✓ {label}: file available")
+                if result.get('url'):
+                    st.code(result['url'])
+            else:
+                st.error(f"{label} error: {result.get('error')}")
+
+def distribute_many(file_path: Path, targets: dict) -> list:
+    """
+    Distribute a file to several destinations concurrently.
+    
+    Each distributor call blocks on network I/O (HTTP, SMTP, S3), so they run
+    on a thread pool and the total wait is roughly that of the slowest one.
+    
+    Args:
+        file_path: File to distribute
+        targets: Mapping of distribution method to its distribute() options
+    
+    Returns:
+        List of (method, result) tuples in the order of targets
+    """
+    # Look up the cached distributors on the script thread (st.cache_resource
+    # expects a script run context); construction failures become results
+    results = {}
+    distributor_for = {}
+    for method in targets:
+        try:
+            distributor_for[method] = get_distributor(method)
+        except Exception as e:
+            results[method] = {'success': False, 'error': str(e)}
+    
+    def distribute_to(method: str) -> dict:
+        try:
+            return distributor_for[method].distribute(file_path, **targets[method])
+        except Exception as e:
+            return {'success': False, 'error': str(e)}
+    
+    if distributor_for:
+        with ThreadPoolExecutor(max_workers=len(distributor_for)) as executor:
+            results.update(zip(distributor_for, executor.map(distribute_to, distributor_for)))
+    return [(method, results[method]) for method in targets]
 
+@_fragment
 def show_sandbox():
     st.header("🧪 Sandbox Testing")
     
-    runner = AgentRunner()
-    monitor = SandboxMonitor()
+    runner = get_runner()
+    monitor = get_monitor()
     
     # File selection
-    generated_files = list(Config.GENERATED_FILES_DIR.glob("*"))
+    generated_files = list_generated_files(Config.GENERATED_FILES_DIR.stat().st_mtime)
     if not generated_files:
         st.warning("No generated files found. Generate a file first.")
         return
@@ -312,12 +408,8 @@ def show_sandbox():
         # Analysis
         analysis = monitor.analyze_result(result)
         
-        risk_color = {
-            'high': '🔴',
-            'medium': '🟡',
-            'low': '🟢'
-        }
-        st.metric("Risk Level", f"{risk_color.get(analysis['risk_level'], '⚪')} {analysis['risk_level'].upper()}")
+        risk_level = analysis['risk_level']
+        st.metric("Risk Level", RISK_LABELS.get(risk_level) or f"⚪ {risk_level.upper()}")
         
         if analysis['findings']:
             st.subheader("Findings")
@@ -354,32 +446,34 @@ def show_sandbox():
         # Save result
         if st.button("Save Result"):
             result_file = runner.save_result(result)
+            load_saved_results.clear()
             st.success(f"Result saved to {result_file}")
     
     # Show previous results
     st.subheader("Previous Test Results")
-    previous_results = runner.load_results()
+    previous_results = load_saved_results()
     
     if previous_results:
-        for prev_result in previous_results[:10]:  # Show last 10
+        for i, prev_result in enumerate(previous_results[:10]):  # Show last 10
             with st.expander(f"{Path(prev_result.get('file_path', 'unknown')).name} - {prev_result.get('timestamp', 'unknown')}"):
                 prev_analysis = monitor.analyze_result(prev_result)
                 st.write(f"**Agent:** {prev_result.get('agent_type', 'unknown')}")
                 st.write(f"**Risk Level:** {prev_analysis['risk_level'].upper()}")
                 st.write(f"**Success:** {prev_result.get('success', False)}")
-                if st.button("View Details", key=f"view_{prev_result.get('timestamp', '')}"):
+                if st.button("View Details", key=f"view_{i}_{prev_result.get('timestamp', '')}"):
                     st.json(prev_result)
         
         if st.button("Generate Report"):
-            report = monitor.generate_report(previous_results)
-            report_path = monitor.save_report(report)
+            # Stream the report to disk, then hand Streamlit the open file
+            report_path = monitor.write_report(previous_results)
             st.success(f"Report generated: {report_path}")
-            st.download_button(
-                "Download Report",
-                data=report,
-                file_name=report_path.name,
-                mime="text/plain"
-            )
+            with report_path.open("rb") as report_file:
+                st.download_button(
+                    "Download Report",
+                    data=report_file,
+                    file_name=report_path.name,
+                    mime="text/plain"
+                )
     else:
         st.info("No previous test results")
 
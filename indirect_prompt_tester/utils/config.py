@@ -19,6 +19,7 @@ class Config:
     TWILIO_ACCOUNT_SID = os.getenv("TWILIO_ACCOUNT_SID", "")
     TWILIO_AUTH_TOKEN = os.getenv("TWILIO_AUTH_TOKEN", "")
     TWILIO_PHONE_NUMBER = os.getenv("TWILIO_PHONE_NUMBER", "")
+    TWILIO_MESSAGING_SERVICE_SID = os.getenv("TWILIO_MESSAGING_SERVICE_SID", "")
     
     # Email Configuration
     SMTP_SERVER = os.getenv("SMTP_SERVER", "smtp.gmail.com")
@@ -36,10 +37,30 @@ class Config:
     HOSTED_FILES_DIR = BASE_DIR / "hosted_files"
     SANDBOX_OUTPUT_DIR = BASE_DIR / "sandbox_output"
     
+    # Sandbox Configuration
+    # Response cache policy for API agents: enabled, read-only, replay, disabled
+    AGENT_CACHE_POLICY = os.getenv("AGENT_CACHE_POLICY", "disabled")
+    AGENT_CACHE_DIR = SANDBOX_OUTPUT_DIR / "cache"
+    # Retries for transient API failures (failed connections, 429, 5xx; read
+    # timeouts are not retried). Worst case per call is (retries + 1) x 60 s
+    # timeout plus retries x 31 s backoff: about 7 minutes at the default of 4
+    AGENT_MAX_RETRIES = int(os.getenv("AGENT_MAX_RETRIES", "4"))
+    # Client-side rate limits per provider (0 = unlimited)
+    OPENAI_RPM = int(os.getenv("OPENAI_RPM", "0"))
+    OPENAI_TPM = int(os.getenv("OPENAI_TPM", "0"))
+    ANTHROPIC_RPM = int(os.getenv("ANTHROPIC_RPM", "0"))
+    ANTHROPIC_TPM = int(os.getenv("ANTHROPIC_TPM", "0"))
+    
+    # Directories created by ensure_directories
+    _ALL_DIRS = (GENERATED_FILES_DIR, HOSTED_FILES_DIR, SANDBOX_OUTPUT_DIR)
+    _dirs_ready = False
+    
     @classmethod
     def ensure_directories(cls):
-        """Ensure all required directories exist."""
-        cls.GENERATED_FILES_DIR.mkdir(exist_ok=True)
-        cls.HOSTED_FILES_DIR.mkdir(exist_ok=True)
-        cls.SANDBOX_OUTPUT_DIR.mkdir(exist_ok=True)
+        """Ensure all required directories exist (once per process)."""
+        if cls._dirs_ready:
+            return
+        for directory in cls._ALL_DIRS:
+            directory.mkdir(parents=True, exist_ok=True)
+        cls._dirs_ready = True
 
@@ -0,0 +1,131 @@
+"""Tests for the sandbox agent runner."""
+import io
+import json
+import sqlite3
+import time
+from contextlib import closing
+
+import pytest
+import requests
+
+from indirect_prompt_tester.sandbox.agent_runner import AgentRunner
+from indirect_prompt_tester.utils.config import Config
+
+
+def test_read_text_prefix_normalizes_line_endings(tmp_path):
+    """CRLF and CR endings read like Path.read_text, before the limit is applied."""
+    file_path = tmp_path / "crlf.txt"
+    file_path.write_bytes(b"line one\r\nline two\r\n bad \xff\xfe\xe2\x82\xac end\r")
+
+    expected = file_path.read_text(encoding='utf-8', errors='ignore')
+    assert expected == "line one\nline two\n bad € end\n"
+    assert AgentRunner._read_text_prefix(file_path, 4000) == expected
+    assert AgentRunner._read_text_prefix(file_path, 12) == expected[:12]
+
+
+def test_request_retries_status_and_charges_rate_limiter(monkeypatch):
+    """429/5xx replies are retried, honouring Retry-After, and each attempt is rate limited."""
+    runner = AgentRunner()
+    replies = [_response(503, {'Retry-After': '0'}), _response(429), _response(200)]
+    calls, sleeps, acquired = [], [], []
+    monkeypatch.setattr(runner.session, 'request', lambda method, url, **kwargs: calls.append(url) or replies.pop(0))
+    monkeypatch.setattr(runner.rate_limiters['openai'], 'acquire', acquired.append)
+    monkeypatch.setattr(time, 'sleep', sleeps.append)
+
+    response = runner._request('openai', 7, "POST", "https://api.openai.com/v1/chat/completions")
+
+    assert response.status_code == 200
+    assert len(calls) == 3
+    assert acquired == [7, 7, 7]
+    assert sleeps[0] == 0
+    assert runner.RETRY_BACKOFF_FACTOR * 2 <= sleeps[1] <= runner.RETRY_BACKOFF_MAX + runner.RETRY_BACKOFF_JITTER
+
+
+def test_request_does_not_retry_read_timeouts(monkeypatch):
+    """A read timeout may follow a processed (billed) request, so it is raised at once."""
+    runner = AgentRunner()
+    calls = []
+
+    def timed_out(method, url, **kwargs):
+        calls.append(url)
+        raise requests.exceptions.ReadTimeout("read timed out")
+
+    monkeypatch.setattr(runner.session, 'request', timed_out)
+    monkeypatch.setattr(time, 'sleep', lambda seconds: None)
+
+    with pytest.raises(requests.exceptions.ReadTimeout):
+        runner._request(None, 0, "POST", "https://example.invalid/")
+    assert len(calls) == 1
+
+
+def test_request_retries_refused_connections(monkeypatch):
+    """Connections that were never established are retried up to the configured limit."""
+    runner = AgentRunner()
+    monkeypatch.setattr(Config, 'AGENT_MAX_RETRIES', 2)
+    monkeypatch.setattr(time, 'sleep', lambda seconds: None)
+    attempts = []
+    original = runner.session.request
+    monkeypatch.setattr(runner.session, 'request', lambda *args, **kwargs: attempts.append(1) or original(*args, **kwargs))
+
+    # Port 1 on localhost is not listening
+    with pytest.raises(requests.ConnectionError):
+        runner._request(None, 0, "GET", "http://127.0.0.1:1/", timeout=5)
+    assert len(attempts) == 3
+
+
+def _response(status_code, headers=None):
+    response = requests.Response()
+    response.status_code = status_code
+    response.headers.update(headers or {})
+    response.raw = io.BytesIO(b"")
+    return response
+
+
+def test_replay_batch_reports_misses_per_file(tmp_path, monkeypatch):
+    """In replay mode a cache miss (or unreadable file) fails that file only, without a live call."""
+    monkeypatch.setattr(Config, 'AGENT_CACHE_DIR', tmp_path / "cache")
+    runner = AgentRunner()
+    monkeypatch.setattr(runner.session, 'request', lambda *args, **kwargs: pytest.fail("replay made a live call"))
+
+    cached_file = tmp_path / "cached.html"
+    cached_file.write_text("<p>cached</p>")
+    missing_file = tmp_path / "missing.html"
+    missing_file.write_text("<p>not cached</p>")
+    unreadable_file = tmp_path / "does-not-exist.html"
+
+    endpoint = "https://example.invalid/scan"
+    _, key = runner._cache_lookup_key('replay', 'custom_api', cached_file, endpoint, "POST")
+    runner._store_cached(key, {'success': True, 'response': 'ok', 'error': ''}, 'enabled')
+
+    results = runner.run_batch(
+        'custom_api',
+        [cached_file, missing_file, unreadable_file],
+        endpoint=endpoint,
+        cache_policy='replay'
+    )
+
+    assert [r['file_path'] for r in results] == [str(cached_file), str(missing_file), str(unreadable_file)]
+    assert results[0]['success'] and results[0]['response'] == 'ok' and results[0]['cached']
+    for result in results[1:]:
+        assert not result['success']
+        assert "replay mode" in result['error']
+
+
+def test_results_index_stores_metadata_only(tmp_path, monkeypatch):
+    """Results live in their JSON files; the index only orders and filters them."""
+    monkeypatch.setattr(Config, 'SANDBOX_OUTPUT_DIR', tmp_path)
+    runner = AgentRunner()
+    older = {'agent_type': 'openai', 'timestamp': '2026-01-01T00:00:00', 'file_path': 'a.txt', 'response': 'x' * 1000}
+    newer = {'agent_type': 'local', 'timestamp': '2026-01-02T00:00:00', 'file_path': 'b.txt', 'output': 'done'}
+    (tmp_path / "result_older.json").write_text(json.dumps(older))
+    runner.save_result(newer)
+
+    assert runner.load_results() == [newer, older]
+    assert runner.load_results(agent_type='openai') == [older]
+
+    with closing(sqlite3.connect(tmp_path / "results_index.db")) as conn:
+        columns = [row[1] for row in conn.execute("PRAGMA table_info(result_files)")]
+    assert columns == ['name', 'mtime_ns', 'ts', 'agent_type', 'file_path']
+
+    (tmp_path / "result_older.json").unlink()
+    assert runner.load_results() == [newer]
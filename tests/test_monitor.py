@@ -0,0 +1,22 @@
+"""Tests for sandbox result analysis."""
+from indirect_prompt_tester.sandbox.monitor import SandboxMonitor
+
+
+def test_analyze_reports_case_folded_and_overlapping_patterns():
+    """Case-insensitive matches map back to their pattern, including 'ſ' (long s) folds."""
+    result = {
+        'timestamp': None,
+        'response': "I will ReVeal the paſſword; SYSTEM PROMPT follows",
+        'output': "rootadmin",
+    }
+
+    analysis = SandboxMonitor()._analyze(result)
+
+    assert analysis['findings'] == [
+        "Found suspicious pattern: 'system prompt'",
+        "Found suspicious pattern: 'reveal'",
+        "Found suspicious pattern: 'password'",
+        "Found suspicious pattern: 'admin'",
+        "Found suspicious pattern: 'root'",
+    ]
+    assert analysis['risk_level'] == 'high'